@@ -15,14 +15,126 @@ becomes high enough, it will stop accelerating due to the increased drag and
 continue it's fall at it's terminal velocity. Freefall can for example be used
 to find an objects terminal velocity, and see if a given height is enough to
 reach it before it lands. This model does not account for the variations in
-air density and gravity depending on altitude. Calculations are done with a
-time step of 0.01 seconds.
+air density and gravity depending on altitude. The fall is solved
+analytically, and the results are resolved to a time step of 0.01 seconds.
 """
 
+from __future__ import annotations
+
+import math
+from functools import lru_cache
+from typing import Any, Dict, Optional, Sequence, SupportsFloat, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        """Stand-in for numba.njit that leaves the function as it is."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda function: function
+
+
+_STEP = 0.01  #Time step in s that results are resolved to
+
+
+def _real(value: Any, message: str) -> float:
+    # Convert a real number, such as an int, a Decimal or a NumPy scalar, to
+    # float. Anything else raises TypeError with the given message. Strings
+    # are rejected even though float() would parse them.
+    if isinstance(value, (str, bytes, bytearray)):
+        raise TypeError(message)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise TypeError(message) from None
+
+
+def _real_array(values: Any, message: str) -> np.ndarray:
+    # Convert a sequence or array of real numbers to a float array. Anything
+    # else, such as strings, raises TypeError with the given message.
+    if np is None:
+        raise ImportError("NumPy is required for batch calculations")
+    values = np.asarray(values)
+    if values.dtype.kind == "O":
+        # Elements of other real types, such as Decimal, are converted one
+        # at a time like the scalar arguments.
+        return np.array([_real(value, message) for value in values.flat],
+                        dtype=float).reshape(values.shape)
+    if values.dtype.kind not in "biuf":
+        raise TypeError(message)
+    return values.astype(float)
+
+
+@njit(cache=True)
+def _simulate(mass: float, area: float, drag_coef: float, density: float,
+              gravity: float, height: float,
+              step: float = _STEP) -> Tuple[float, float]:
+    # Return the time and speed at impact. With drag the position is
+    # s(t) = (v_term^2/g)*ln(cosh(g*t/v_term)), which is inverted for the time
+    # of impact, and without drag s(t) = g*t^2/2. The time is then resolved
+    # to the nearest whole time step, but is never less than one step.
+    if density != 0:
+        v_term = math.sqrt((2*mass*gravity)/(density*drag_coef*area))
+        if v_term == 0:
+            # An object of vanishing density never reaches the ground.
+            return (math.inf, 0.0)
+        k = gravity/v_term
+        y = height*k/v_term
+        # Drag changes the time by a relative amount of the order of y. Below
+        # float precision, or when v_term overflows and y is 0, the drag-free
+        # solution is used instead.
+        if y >= 1e-16:
+            t = (y + math.log1p(math.sqrt(-math.expm1(-2*y))))/k
+            t = max(1.0, round(t/step, 0))*step
+            return (t, v_term*math.tanh(k*t))
+    t = max(1.0, round(math.sqrt(2*height/gravity)/step, 0))*step
+    return (t, gravity*t)
+
+
+@lru_cache(maxsize=128)
+def _solve(mass: float, area: float, drag_coef: float, density: float,
+           gravity: float, height: float) -> Tuple[float, float]:
+    # Memoized _simulate. The key covers every property of the model, so
+    # changing one through a setter needs no cache clearing.
+    return _simulate(mass, area, drag_coef, density, gravity, height)
+
+
+def _solve_array(mass: Any, area: Any, drag_coef: Any, density: Any,
+                 gravity: Any, height: np.ndarray
+                 ) -> Tuple[np.ndarray, np.ndarray]:
+    # NumPy version of _simulate. The arguments are broadcast together and the
+    # time and speed at impact are returned as arrays. Elements where drag is
+    # absent or negligible produce inf and nan in the drag branch, which
+    # np.where discards.
+    step = _STEP
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        v_term = np.sqrt(np.divide(2*mass*gravity, density*drag_coef*area))
+        k = gravity/v_term
+        y = height*k/v_term
+        drag = y >= 1e-16
+        t = (y + np.log1p(np.sqrt(-np.expm1(-2*y))))/k
+        t = np.where(drag, t, np.sqrt(2*height/gravity))
+        t = np.where(v_term == 0, np.inf, t)
+        t = np.maximum(1, np.round(t/step))*step
+        v = np.where(drag, v_term*np.tanh(k*t), gravity*t)
+    return (t, v)
+
+
 class Freefall:
     """This class implements a model of an object in free fall."""
 
-    def __init__(self, mass, area, drag_coef=1, density=1.2, gravity=9.81):
+    __slots__ = ("_m", "_A", "_C", "_p", "_g", "_v_term", "_d_sat",
+                 "_props")
+
+    def __init__(self, mass: SupportsFloat, area: SupportsFloat,
+                 drag_coef: SupportsFloat = 1, density: SupportsFloat = 1.2,
+                 gravity: SupportsFloat = 9.81) -> None:
         """Construct an model taking the mass in kg and cross sectional area in
         m^3. They need to be larger than 0. Additional optional arguments are:
 
@@ -36,13 +148,18 @@ class Freefall:
           9.81 m/(s^2), representing standard gravity at the surface of the
           earth.
 
-        Each argument can be given as int or float. Other types will cause a
-        TypeError. Values outside the specified ranges will cause a ValueError.
+        Each argument can be given as int or float, or as another real number
+        type such as a Decimal or a NumPy scalar, and is stored as a float.
+        Other types, including strings, will cause a TypeError.
+        Values outside the specified ranges will cause a ValueError.
         """
 
-        for arg in [mass, area, drag_coef, density, gravity]:
-            if not isinstance(arg, (int, float)):
-                raise TypeError("All arguments must be of type int or float")
+        message = "All arguments must be of type int or float"
+        mass = _real(mass, message)
+        area = _real(area, message)
+        drag_coef = _real(drag_coef, message)
+        density = _real(density, message)
+        gravity = _real(gravity, message)
         for arg in [mass, area, drag_coef, gravity]:
             if arg <= 0:
                 raise ValueError("Argument is outside specified range")
@@ -54,108 +171,178 @@ class Freefall:
         self._C = drag_coef  #Drag coefficient
         self._p = density    #Density of air in kg/(m^3)
         self._g = gravity    #Gravity acceleration in m/(s^2)
+        self._recompute()
 
-    def set_drag_coef(self, drag_coef):
+    def set_drag_coef(self, drag_coef: SupportsFloat) -> None:
         """Modify drag coefficient C to a float or int larger than 0 and
         less than 2. Value outside of that range causes ValueError. Wrong
         type causes TypeError.
         """
-        if not isinstance(drag_coef, (int, float)):
-            raise TypeError("C must be of type int or float")
-        elif drag_coef <= 0 or drag_coef >= 2:
+        drag_coef = _real(drag_coef, "C must be of type int or float")
+        if drag_coef <= 0 or drag_coef >= 2:
             raise ValueError("C must be larger than 0 and less than 2")
         self._C = drag_coef
+        self._recompute()
 
-    def set_density(self, density):
+    def set_density(self, density: SupportsFloat) -> None:
         """Modify air density p to a non-negative float or int in kg/(m^3).
         Wrong range causes ValueError. Wrong type causes TypeError.
         """
-        if not isinstance(density, (int, float)):
-            raise TypeError("p must be of type int or float")
-        elif density < 0:
+        density = _real(density, "p must be of type int or float")
+        if density < 0:
             raise ValueError("p must be non-negative")
         self._p = density
+        self._recompute()
 
-    def set_gravity(self, gravity):
+    def set_gravity(self, gravity: SupportsFloat) -> None:
         """Modify gravity g to a positive float or int in m/(s^2). A zero or
         negative g causes ValueError. Wrong type causes TypeError.
         """
-        if not isinstance(gravity, (int, float)):
-            raise TypeError("g must be of type int or float")
-        elif gravity <= 0:
+        gravity = _real(gravity, "g must be of type int or float")
+        if gravity <= 0:
             raise ValueError("g must be larger than 0")
         self._g = gravity
+        self._recompute()
 
-    def set_size(self, mass, area):
+    def set_size(self, mass: SupportsFloat, area: SupportsFloat) -> None:
         """Modify the mass in kg and cross sectional area in m^3 as positive
         int or float parameters. Zero or negative values causes ValueError.
         Wrong type causes TypeError.
         """
-        if not isinstance(mass, (int, float)) or not isinstance(area, (int, float)):
-            raise TypeError("A and m must be of type int or float")
-        elif mass <= 0 or area <= 0:
+        mass = _real(mass, "A and m must be of type int or float")
+        area = _real(area, "A and m must be of type int or float")
+        if mass <= 0 or area <= 0:
             raise ValueError("A and m must be larger than 0")
         self._m = mass
         self._A = area
+        self._recompute()
 
-    def properties(self):
+    def properties(self) -> Dict[str, float]:
         """Return a dict with the models properties (mass, area,
         drag coefficient, air density, and gravity) as keys and their
         current values in SI-units as values.
         """
-        return {"m (kg)": self._m, "A (m^2)": self._A, "C": self._C,
-                "p (kg/(m^3))": self._p, "g (m/(s^2))": self._g}        
+        return self._props.copy()
 
-    def terminal(self):
+    def terminal(self) -> Optional[float]:
         """Calculate and return the terminal velocity of the object in m/s
         as a float rounded to two decimals. Return None if air density p = 0.
         """
-        if self._p == 0:
+        if self._v_term is None:
             return None
-        v_term = ((2*self._m*self._g)/(self._p*self._C*self._A))**0.5
-        return round(v_term, 2)
+        return round(self._v_term, 2)
 
-    def air_time(self, height):
+    def air_time(self, height: SupportsFloat) -> float:
         """Calculate and return the time until the object hits the ground
         when released from a height. The time is in s and represented as a
         float rounded to two decimals. The height is in m and is input as a
         positive int or float. Zero or negative values causes ValueError.
         Other types causes TypeError.
         """
-        if not isinstance(height, (int, float)):
-            raise TypeError("Height must be of type int or float")
-        elif height <= 0:
+        height = _real(height, "Height must be of type int or float")
+        if not height > 0:
             raise ValueError("Height must be larger than 0")
-        t_air = self._calculator(height)[0][-1]
+        t_air = self._calculator(height)[0]
         return round(t_air, 2)
 
-    def landing_speed(self, height):
+    def landing_speed(self, height: SupportsFloat) -> float:
         """Calculate and return the speed at impact with the ground when
         released from a height. The speed is in m/s and represented as a
         float rounded to two decimals. The height is in m and is input as a
         positive int or float. Zero or negative values causes ValueError.
         Other types causes TypeError.
         """
-        if not isinstance(height, (int, float)):
-            raise TypeError("Height must be of type int or float")
-        elif height <= 0:
+        height = _real(height, "Height must be of type int or float")
+        if not height > 0:
             raise ValueError("Height must be larger than 0")
-        v_land = self._calculator(height)[1][-1]
+        if self._v_term is not None and height > self._d_sat:
+            return round(self._v_term, 2)
+        v_land = self._calculator(height)[1]
         return round(v_land, 2)
 
-    def _calculator(self, height):
-        v = 0
-        t = 0
-        step = 0.01
-        time_vector = [t]
-        speed_vector = [v]
-
-        while height > 0:
-            drag = 0.5*self._C*self._p*self._A*v**2
-            acc = self._g-drag/self._m
-            v = v+acc*step
-            speed_vector.append(v)
-            height = height-v*step
-            t += step
-            time_vector.append(t)
-        return(time_vector, speed_vector)          
+    @staticmethod
+    def sweep(masses: Any, areas: Any, heights: Any, drag_coefs: Any = 1,
+              densities: Any = 1.2, gravities: Any = 9.81
+              ) -> Tuple[np.ndarray, np.ndarray]:
+        """Calculate air times and landing speeds for many objects at once,
+        without creating a model for each. Every argument is a number, a
+        sequence or a NumPy array, and they are broadcast together. Each
+        element pairs the properties of one object with the height it is
+        released from, which have the same meaning and ranges as for the
+        constructor and air_time().
+
+        Return a tuple of two NumPy arrays with the air times in s and the
+        landing speeds in m/s, rounded to two decimals. Values outside the
+        specified ranges cause ValueError. Non-numeric values cause
+        TypeError. NumPy must be installed, or ImportError is raised.
+        """
+        message = "All arguments must be of type int or float"
+        m, A, C, p, g, h = np.broadcast_arrays(
+            *[_real_array(arg, message) for arg in
+              [masses, areas, drag_coefs, densities, gravities, heights]])
+        for arg in [m, A, C, g, h]:
+            if not np.all(arg > 0):
+                raise ValueError("Argument is outside specified range")
+        if not (np.all(C < 2) and np.all(p >= 0)):
+            raise ValueError("Argument is outside specified range")
+        t_air, v_land = _solve_array(m, A, C, p, g, h)
+        return (np.round(t_air, 2), np.round(v_land, 2))
+
+    def air_times(self, heights: Sequence[SupportsFloat] | np.ndarray
+                  ) -> np.ndarray:
+        """Calculate the air time for each height in a sequence or NumPy
+        array, and return them as a NumPy array of the same shape. Each
+        value is calculated as by air_time(). Heights that are not positive
+        cause ValueError. Non-numeric heights cause TypeError. NumPy must be
+        installed, or ImportError is raised.
+        """
+        t_air = self._batch(heights)[0]
+        return np.round(t_air, 2)
+
+    def landing_speeds(self, heights: Sequence[SupportsFloat] | np.ndarray
+                       ) -> np.ndarray:
+        """Calculate the landing speed for each height in a sequence or NumPy
+        array, and return them as a NumPy array of the same shape. Each
+        value is calculated as by landing_speed(). Heights that are not
+        positive cause ValueError. Non-numeric heights cause TypeError. NumPy
+        must be installed, or ImportError is raised.
+        """
+        v_land = self._batch(heights)[1]
+        return np.round(v_land, 2)
+
+    def _batch(self, heights: Sequence[SupportsFloat] | np.ndarray
+               ) -> Tuple[np.ndarray, np.ndarray]:
+        heights = _real_array(heights, "Height must be of type int or float")
+        if not np.all(heights > 0):
+            raise ValueError("Height must be larger than 0")
+        return _solve_array(self._m, self._A, self._C, self._p, self._g,
+                            heights)
+
+    def _recompute(self) -> None:
+        # Update the properties dict, the terminal velocity in m/s and
+        # the height in m above which the landing speed equals it. Called
+        # whenever a property is set.
+        self._props = {"m (kg)": self._m, "A (m^2)": self._A, "C": self._C,
+                       "p (kg/(m^3))": self._p, "g (m/(s^2))": self._g}
+        if self._p == 0:
+            self._v_term = None
+            self._d_sat = math.inf
+            return
+        self._v_term = math.sqrt((2*self._m*self._g)/
+                                 (self._p*self._C*self._A))
+        if self._v_term == 0:
+            # The terminal velocity underflows for objects of vanishing
+            # density, and every drop lands at that speed.
+            self._d_sat = 0.0
+            return
+        # tanh(x) rounds to exactly 1.0 for x >= 20, so the speed is v_term
+        # once g*t/v_term reaches 20 after the time is resolved to a whole
+        # step, which can round it down by half a step. The height is
+        # s(t) = (v_term^2/g)*ln(cosh(g*t/v_term)), written in a form that
+        # does not overflow.
+        x = 20 + 0.5*_STEP*self._g/self._v_term
+        self._d_sat = (self._v_term*self._v_term/self._g)*(
+            x + math.log1p(math.exp(-2*x)) - math.log(2))
+
+    def _calculator(self, height: float) -> Tuple[float, float]:
+        return _solve(self._m, self._A, self._C, self._p, self._g, height)
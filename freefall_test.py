@@ -1,5 +1,7 @@
 # Unit test
 
+from decimal import Decimal
+
 import freefall
 step = 0.01
 model = freefall.Freefall(85, 0.7)
@@ -20,11 +22,40 @@ model.set_drag_coef(p[2])
 model.set_density(p[3])
 model.set_gravity(p[4])
 test_properties()
+props = model.properties()
+assert type(props) == dict
+props["C"] = 1.5
+assert model.properties()["C"] == p[2] #changing the returned dict does not change the model
+model.set_drag_coef(1.5)
+props = model.properties()
+model.set_drag_coef(p[2])
+assert props["C"] == 1.5 #properties taken before a setter call keep their values
+assert model.properties()["C"] == p[2]
+
+# test argument types
+other = freefall.Freefall(Decimal("85"), 0.7)
+other.set_density(Decimal("1.2"))
+for value in other.properties().values():
+    assert type(value) == float #arguments are stored as floats
+if freefall.np is not None:
+    other.set_gravity(freefall.np.float32(9.81)) #NumPy scalars are accepted
+    assert type(other.properties()["g (m/(s^2))"]) == float
+for value in ["3", b"3", None, [1], 1j]:
+    try:
+        other.set_drag_coef(value)
+        assert False #only real numbers are accepted
+    except TypeError:
+        pass
 
 # test terminal()
 assert model.terminal() == round(((2*p[0]*p[4])/(p[3]*p[2]*p[1]))**0.5, 2) #equation for terminal velocity
 model.set_size(1e-10, 1e10)
 assert model.terminal() == 0 #terminal velocity approaches 0 when object density approaches 0
+model.set_size(1e-200, 1e200)
+assert model.terminal() == 0 #terminal velocity can underflow to 0
+assert model.landing_speed(10) == 0
+assert freefall.Freefall(1e-200, 1e200).terminal() == 0
+assert freefall.Freefall(1e-200, 1e200).air_time(10) == float("inf") #object never lands when terminal velocity is 0
 model.set_density(0)
 assert model.terminal() == None #there is no terminal velocity when there is no air resistance
 
@@ -38,12 +69,21 @@ for height in [0.1, 0.2, 1, 99.99, 100, 1000]:
     previous = current
 assert model.air_time(1e-10) == step #air time is one timestep when height approaches 0
 assert model.air_time(1e6) == model.air_time(1e6) #function gives same output for same argument
+for height in [0, -1, float("nan")]:
+    try:
+        model.air_time(height)
+        assert False #air time is not defined for heights that are not positive
+    except ValueError:
+        pass
 model.set_gravity(1e10)
 assert model.air_time(1000) == step #air time is one timestep when gravity approaches infinity
 model.set_gravity(p[4])
 model.set_density(0)
 for height in [0.1, 0.2, 1, 99.99, 100, 1000]:
     assert model.air_time(height) == round(((2*height/p[4])**0.5), 2) #t = (2s/a)^2 when there is no air resistance
+for model in [freefall.Freefall(85, 0.7, density=1e-305), freefall.Freefall(1e160, 1e-160)]:
+    assert model.air_time(10) == 1.43 #negligible air resistance gives the same output as none
+    assert model.landing_speed(10) == 14.03
 
 # test landing_speed()
 model = freefall.Freefall(85, 0.7)
@@ -54,6 +94,54 @@ for height in [0.1, 0.2, 1, 99.99, 100, 1000]:
     assert current >= previous #landing speed never decreases when height increases
     previous = current
 assert model.landing_speed(350) == model.landing_speed(350) #function gives same output for same argument
+for height in [0, -1, float("nan")]:
+    try:
+        model.landing_speed(height)
+        assert False #landing speed is not defined for heights that are not positive
+    except ValueError:
+        pass
 assert model.landing_speed(1e-10) == round(p[4]*step, 2) #landing speed is gravity*timestep when height approaches 0
 assert model.landing_speed(1000) == model.terminal() #landing speed is equal to terminal velocity for high heights
 assert model.landing_speed(10) < model.terminal() #landing speed is lower than terminal velocity for low heights
+for height in [model._d_sat*0.999999, model._d_sat*1.000001]:
+    assert model.landing_speed(height) == round(model._calculator(height)[1], 2) #shortcut for tall drops gives same output as full solution
+assert model._calculator(model._d_sat*1.000001)[1] == model._v_term #speed has reached terminal velocity above the shortcut height
+
+# test air_times() and landing_speeds()
+if freefall.np is not None:
+    heights = [1e-10, 0.1, 10, 99.99, 350, 1000, 1e6]
+    for density in [1.2, 0, 1e-305]:
+        model = freefall.Freefall(85, 0.7, density=density)
+        times = model.air_times(heights)
+        speeds = model.landing_speeds(heights)
+        for i in range(len(heights)):
+            assert times[i] == model.air_time(heights[i]) #batch gives same output as single height
+            assert speeds[i] == model.landing_speed(heights[i])
+    assert model.air_times([Decimal(10)])[0] == model.air_time(Decimal(10)) #other real number types are accepted
+else:
+    print("NumPy is not installed, skipping the air_times() and landing_speeds() test")
+
+# test sweep()
+if freefall.np is not None:
+    masses = [85, 1, 1e3]
+    heights = [[0.1], [100], [1e4]]
+    times, speeds = freefall.Freefall.sweep(masses, 0.7, heights, densities=[1.2, 0, 1.2])
+    for i in range(len(heights)):
+        for j in range(len(masses)):
+            model = freefall.Freefall(masses[j], 0.7, density=[1.2, 0, 1.2][j])
+            assert times[i][j] == model.air_time(heights[i][0]) #sweep gives same output as one model per object
+            assert speeds[i][j] == model.landing_speed(heights[i][0])
+    for m, A, p in [(85, 0.7, 1e-305), (1e160, 1e-160, 1.2)]:
+        times, speeds = freefall.Freefall.sweep(m, A, 10, densities=p)
+        assert times == 1.43 and speeds == 14.03 #negligible air resistance gives the same output as none
+else:
+    print("NumPy is not installed, skipping the sweep() test")
+
+# test that the compiled solver agrees with plain Python
+if hasattr(freefall._simulate, "py_func"):
+    for density in [1.2, 0, 1e-305]:
+        for height in [1e-10, 0.1, 100, 1e6, 1e19, 1e300]:
+            args = (85.0, 0.7, 1.0, density, 9.81, height)
+            assert freefall._simulate(*args) == freefall._simulate.py_func(*args) #JIT gives same output as Python
+else:
+    print("Numba is not installed, skipping the compiled solver test")